@@ -1,3 +1,4 @@
+import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.collections import LineCollection
 from matplotlib import rcParams
@@ -5,6 +6,17 @@ import seaborn as sns
 from fastf1 import plotting
 import os
 
+# Marker for "setup_mpl has not run in this process yet"
+_UNSET = object()
+
+# Color scheme last applied through fastf1.plotting.setup_mpl, and the
+# rcParams left behind by that setup_plot call
+_current_scheme = _UNSET
+_applied_rc = None
+
+# Absolute paths of media directories already created by save_fig in this session
+_created_dirs = set()
+
 def setup_plot(cs='fastf1', xyticksize=18, axeslabel=20, figtitle=24, legendfont=18, legendtitle=20, grid=True):
     """
     Configure Matplotlib's global plotting parameters for consistent styling.
@@ -44,44 +56,53 @@ def setup_plot(cs='fastf1', xyticksize=18, axeslabel=20, figtitle=24, legendfont
     ------
     Confirmation message once parameters are initialized.
     """
-    # FastF1 default color scheme
-    plotting.setup_mpl(color_scheme=cs)
+    global _current_scheme, _applied_rc
+
+    # FastF1 default color scheme. Skipped only when the same scheme was already
+    # applied and rcParams are untouched since (no rcdefaults/style change)
+    if _current_scheme is _UNSET or cs != _current_scheme or rcParams.copy() != _applied_rc:
+        plotting.setup_mpl(color_scheme=cs)
+        _current_scheme = cs
 
-    # Font sizes
-    rcParams['xtick.labelsize'] = xyticksize
-    rcParams['ytick.labelsize'] = xyticksize
-    rcParams['axes.labelsize'] = axeslabel
-    rcParams['axes.labelweight'] = 'bold'
-    rcParams['axes.titlesize'] = figtitle
-    rcParams['axes.titleweight'] = 'bold'
-    rcParams['legend.fontsize'] = legendfont
-    rcParams['legend.title_fontsize'] = legendtitle
+    params = {
+        # Font sizes
+        'xtick.labelsize': xyticksize,
+        'ytick.labelsize': xyticksize,
+        'axes.labelsize': axeslabel,
+        'axes.labelweight': 'bold',
+        'axes.titlesize': figtitle,
+        'axes.titleweight': 'bold',
+        'legend.fontsize': legendfont,
+        'legend.title_fontsize': legendtitle,
 
-    # Legend styling
-    rcParams['legend.facecolor'] = '#000000'
-    rcParams['legend.edgecolor'] = 'white'
+        # Legend styling
+        'legend.facecolor': '#000000',
+        'legend.edgecolor': 'white',
 
-    # Grid styling
-    rcParams['grid.color'] = '#333333'
+        # Grid styling
+        'grid.color': '#333333',
 
-    # Optional: set grid visibility by default
-    rcParams['axes.grid'] = grid
+        # Optional: set grid visibility by default
+        'axes.grid': grid,
 
-    # Auto layout to mimic tight_layout()
-    rcParams['figure.autolayout'] = True    
+        # Auto layout to mimic tight_layout()
+        'figure.autolayout': True,
 
-    # Set animation size limit
-    rcParams['animation.embed_limit'] = 200
+        # Set animation size limit
+        'animation.embed_limit': 200,
 
-    # Enable ffmpeg
-    rcParams['animation.ffmpeg_path'] = r"C:\Users\rushi\AppData\Local\ffmpeg-7.1.1-essentials_build\bin\ffmpeg.exe"
+        # Enable ffmpeg
+        'animation.ffmpeg_path': r"C:\Users\rushi\AppData\Local\ffmpeg-7.1.1-essentials_build\bin\ffmpeg.exe",
+    }
+    rcParams.update(params)
+    _applied_rc = rcParams.copy()
 
     print("Matplotlib rcParams initialized with custom style.")
 
 
-def save_fig(fig, name, loc, trs=True, dpi=300):
+def save_fig(fig, name, loc, trs=True, dpi=300, ext='png'):
     """
-    Save a matplotlib figure as a PNG file in a specified directory.
+    Save a matplotlib figure as a PNG (or PDF) file in a specified directory.
 
     Parameters
     ----------
@@ -97,21 +118,39 @@ def save_fig(fig, name, loc, trs=True, dpi=300):
         Default is True, no background.
     dpi : int, optional
         Resolution of the saved figure in dots per inch (default is 300).
+        For PDF output this only applies to rasterized artists.
+    ext : str, optional
+        File format, 'png' or 'pdf' (default is 'png').
 
     Notes
     -----
-    - The figure will be saved as a .png file.
+    - PNGs are written with a low zlib compression level for faster saves.
     - If a file with the same name exists, it will be overwritten.
     """
     # Build full directory and path
     dir_path = f"./media/{loc}"
-    full_path = f"{dir_path}/{name}.png"
-    
-    # Create directory if it doesn't exist
-    os.makedirs(dir_path, exist_ok=True)
+    full_path = f"{dir_path}/{name}.{ext}"
     
+    # Create directory if it doesn't exist (once per session, keyed on the absolute path)
+    abs_dir = os.path.abspath(dir_path)
+    if abs_dir not in _created_dirs:
+        os.makedirs(abs_dir, exist_ok=True)
+        _created_dirs.add(abs_dir)
+
+    savefig_kwargs = {'transparent': trs, 'dpi': dpi, 'bbox_inches': 'tight'}
+    if ext == 'png':
+        # Fast zlib pass: slightly larger files, noticeably quicker writes
+        savefig_kwargs['pil_kwargs'] = {'compress_level': 1}
+
     try:
-        fig.savefig(full_path, transparent=trs, dpi=dpi, bbox_inches='tight')
+        try:
+            fig.savefig(full_path, **savefig_kwargs)
+        except FileNotFoundError:
+            # Directory was removed after it was cached: recreate it and retry once
+            _created_dirs.discard(abs_dir)
+            os.makedirs(abs_dir, exist_ok=True)
+            _created_dirs.add(abs_dir)
+            fig.savefig(full_path, **savefig_kwargs)
         print(f"Figure saved at {full_path}")
     except Exception as e:
         print(f"Error saving figure: {e}")
@@ -126,7 +165,7 @@ def plot_track_dominance(points, segments, colors, figsize=(12, 10), linewidth=1
     points : np.ndarray
         Array of (x, y) coordinates reshaped for LineCollection plotting.
     segments : np.ndarray
-        Array of line segments for LineCollection.
+        Array of line segments for LineCollection, shape (n_segments, 2, 2).
     colors : np.ndarray
         Array of colors corresponding to which driver is fastest at each point.
     figsize : tuple, optional
@@ -138,20 +177,36 @@ def plot_track_dominance(points, segments, colors, figsize=(12, 10), linewidth=1
     -------
     fig : matplotlib.figure.Figure
         The created matplotlib Figure object.
+
+    Notes
+    -----
+    - Layout is handled by `figure.autolayout` (see `setup_plot`).
+    - The figure is not shown here; use `display(fig)` or `save_fig`.
     """
     fig, ax = plt.subplots(figsize=figsize)
     fig.set_facecolor("#000000")
     ax.axis("off")
 
-    # Match segments length (N-1) with colors
-    lc = LineCollection(segments, colors=colors[:-1], linewidth=linewidth)
+    # Match segments length (N-1) with colors, then merge runs of the same
+    # color into one multi-vertex path each
+    segments = np.asarray(segments)
+    seg_colors = np.asarray(colors)[:len(segments)]
+    changed = seg_colors[1:] != seg_colors[:-1]
+    if changed.ndim > 1:
+        changed = changed.any(axis=tuple(range(1, changed.ndim)))
+    starts = np.concatenate([[0], np.flatnonzero(changed) + 1])
+    stops = np.append(starts[1:], len(seg_colors))
+
+    segments_rle = [np.concatenate([segments[start:stop, 0], segments[stop-1:stop, 1]])
+                    for start, stop in zip(starts, stops)]
+
+    lc = LineCollection(segments_rle, colors=seg_colors[starts], linewidth=linewidth)
+    # Rasterize the dense track so vector outputs don't embed every segment as a path
+    lc.set_rasterized(True)
 
     ax.add_collection(lc)
     ax.autoscale()
 
-    plt.tight_layout()
-    plt.show()
-
     return fig
 
 
@@ -1,8 +1,246 @@
+import os
+import weakref
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pandas as pd
-import statsmodels.api as sm
+import pyarrow as pa
+import pyarrow.feather as feather
+from numpy.lib.stride_tricks import sliding_window_view
 import fastf1.plotting as plotting
-    
+from fastf1.core import Laps
+
+
+# Per-session derived data (telemetry arrays, circuit info), dropped when the session is garbage collected
+_session_cache = weakref.WeakKeyDictionary()
+
+
+class LinFit(namedtuple('LinFit', ['intercept', 'slope', 'n', 'resid_ss', 'rsquared'])):
+
+    """
+    Lightweight result of a `LapTime ~ const + TyreLife` stint fit.
+
+    Attributes
+    ----------
+    intercept : float
+        Fitted lap time (in seconds) at zero tyre life.
+    slope : float
+        Tyre degradation in seconds per lap.
+    n : int
+        Number of laps used in the fit.
+    resid_ss : float
+        Residual sum of squares.
+    rsquared : float
+        Coefficient of determination (NaN if all lap times are equal).
+    """
+
+    __slots__ = ()
+
+    @property
+    def params(self):
+        """Coefficients labelled like a statsmodels OLS fit ('const', 'TyreLife')."""
+        return pd.Series({'const': self.intercept, 'TyreLife': self.slope})
+
+
+def _fit_stint(x, y):
+
+    """
+    Closed-form ordinary least squares fit of `y = intercept + slope * x`.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Regressor values (tyre life in laps).
+    y : numpy.ndarray
+        Response values (fuel-corrected lap times in seconds).
+
+    Returns
+    -------
+    LinFit
+        Fitted intercept, slope, sample size, residual sum of squares and R-squared.
+    """
+
+    n = x.size
+    x_mean, y_mean = x.mean(), y.mean()
+
+    # Centered sums of squares: numerically stable for lap times around ~90 s
+    dx, dy = x - x_mean, y - y_mean
+    sxx, sxy, syy = dx @ dx, dx @ dy, dy @ dy
+
+    if sxx == 0:
+        raise np.linalg.LinAlgError("Singular fit: regressor is constant")
+
+    slope = sxy/sxx
+    intercept = y_mean - slope*x_mean
+    resid_ss = max(syy - slope*sxy, 0.0)
+    rsquared = slope*sxy/syy if syy > 0 else np.nan
+
+    return LinFit(float(intercept), float(slope), int(n), float(resid_ss), float(rsquared))
+
+
+def _cached(session, key, laps, build):
+
+    """
+    Return a per-session cache entry derived from `laps`, building it on a miss.
+
+    The entry holds only a weak reference to `laps` (which itself references the
+    session), so cached sessions can still be garbage collected. It is reused
+    only for that exact Laps object, so a recycled `id(laps)` never returns
+    stale data.
+    """
+
+    cache = _session_cache.setdefault(session, {})
+    entry = cache.get(key)
+    if entry is None or entry[0]() is not laps:
+        entry = (weakref.ref(laps), build())
+        cache[key] = entry
+
+    return entry[1]
+
+
+def _telemetry_arrays(session, drv, kind, laps=None, lap1=None):
+
+    """
+    Fetch (and cache) a driver's telemetry channels as float64 arrays.
+
+    Parameters
+    ----------
+    session : fastf1.core.Session
+        A FastF1 session object (already loaded). Used as the cache key.
+    drv : str
+        Driver identifier, e.g. "VER" or "1". Must be the driver number for 'lap1'.
+    kind : {'fastest', 'lap1'}
+        - 'fastest' : fastest-lap telemetry with 'Distance', 'Speed', 'X', 'Y'.
+        - 'lap1' : lap 1 car data with 'Time' (in seconds) and 'Speed'.
+    laps : fastf1.core.Laps, optional
+        Laps to pick from. Defaults to `session.laps`. Cached arrays are kept
+        separately for each Laps object.
+    lap1 : dict[str, fastf1.core.Laps], optional
+        Lap 1 of `laps` already split by driver number, used on a 'lap1' cache
+        miss instead of picking it from `laps` again.
+
+    Returns
+    -------
+    dict[str, numpy.ndarray]
+        Channel name -> array. Only arrays are cached, never Laps objects.
+    """
+
+    if laps is None:
+        laps = session.laps
+
+    def _build():
+        if kind == 'fastest':
+            tel = laps.pick_drivers(drv).pick_fastest().get_telemetry()
+            cols = ['Distance', 'Speed', 'X', 'Y']
+        elif kind == 'lap1':
+            drv_lap1 = lap1[drv] if lap1 is not None else laps.pick_laps(1).pick_drivers(drv)
+            tel = drv_lap1.get_car_data(interpolate_edges=True)[['Time', 'Speed']]
+            tel['Time'] = tel['Time'].dt.total_seconds()
+            cols = ['Time', 'Speed']
+        else:
+            raise ValueError(f"Unknown telemetry kind: {kind}")
+        return {col: tel[col].to_numpy(dtype=np.float64) for col in cols}
+
+    return _cached(session, (drv, kind, id(laps)), laps, _build)
+
+
+def _circuit_info(session):
+
+    """
+    Fetch (and cache) the circuit info of a session.
+
+    Parameters
+    ----------
+    session : fastf1.core.Session
+        A FastF1 session object (already loaded).
+
+    Returns
+    -------
+    fastf1.mvapi.CircuitInfo
+        Result of `session.get_circuit_info()`.
+    """
+
+    cache = _session_cache.setdefault(session, {})
+    if 'circuit_info' not in cache:
+        cache['circuit_info'] = session.get_circuit_info()
+
+    return cache['circuit_info']
+
+
+def load_laps_cached(session, path):
+
+    """
+    Load a session's laps from a Feather (Arrow IPC) file, creating it on first use.
+
+    The file is tagged with the session it was written from. A file written for a
+    different session is overwritten with the laps of `session` instead of being
+    returned. Repeated calls return the same Laps object while it is still alive,
+    so the per-session telemetry caches keep hitting.
+
+    Parameters
+    ----------
+    session : fastf1.core.Session
+        The loaded FastF1 session object.
+    path : str
+        Path of the .feather file used to store the laps.
+
+    Returns
+    -------
+    fastf1.core.Laps
+        Laps bound to `session`, so telemetry methods keep working.
+    """
+
+    # Only a weak reference: Laps holds the session, so a strong one would pin it
+    cache = _session_cache.setdefault(session, {})
+    key = ('laps_file', os.path.abspath(path))
+    laps = cache[key]() if key in cache else None
+    if laps is not None:
+        return laps
+
+    session_id = f"{session.event.EventName}|{session.name}|{session.date}".encode()
+
+    if os.path.exists(path):
+        table = feather.read_table(path)
+        if (table.schema.metadata or {}).get(b'f1_session') == session_id:
+            laps = Laps(table.to_pandas(), session=session)
+
+    if laps is None:
+        laps = session.laps.reset_index(drop=True)
+        table = pa.Table.from_pandas(laps, preserve_index=False)
+        table = table.replace_schema_metadata({**table.schema.metadata, b'f1_session': session_id})
+        feather.write_feather(table, path)
+
+    cache[key] = weakref.ref(laps)
+
+    return laps
+
+
+def _fuel_corrected(lt, ln, total_laps, k):
+
+    """
+    Fuel-correct lap times on plain arrays.
+
+    Parameters
+    ----------
+    lt : numpy.ndarray
+        Lap times in seconds.
+    ln : numpy.ndarray
+        Lap numbers, aligned with `lt`.
+    total_laps : int
+        Total number of laps in the session.
+    k : float
+        Lap time gained per lap of fuel burned, in seconds
+        (fuel burn in kg/lap x fuel correction factor in s/kg).
+
+    Returns
+    -------
+    numpy.ndarray
+        Fuel-corrected lap times (in seconds), rounded to 2 decimals.
+    """
+
+    return np.round(lt - (total_laps - ln) * k, 2)
+
 
 def fuel_correction(session,df,iFuelLoad=108,FC_factor=0.035):
 
@@ -29,10 +267,12 @@ def fuel_correction(session,df,iFuelLoad=108,FC_factor=0.035):
     """
 
     laps = session.total_laps
-    fuel_burn = iFuelLoad/laps      # kg/lap
-    fuel_corr = FC_factor           # s/kg
+    k = (iFuelLoad/laps) * FC_factor    # s/lap, fuel burn (kg/lap) x fuel correction (s/kg)
 
-    return round(df['LapTime'] - (laps - df['LapNumber']) * fuel_burn * fuel_corr, 2)
+    lt = df['LapTime'].to_numpy(dtype=np.float64)
+    ln = df['LapNumber'].to_numpy(dtype=np.float64)
+
+    return pd.Series(_fuel_corrected(lt, ln, laps, k), index=df.index)
 
 
 def get_acc_time(df,target_speed):
@@ -58,17 +298,63 @@ def get_acc_time(df,target_speed):
         rounded to 2 decimals.
     """
 
-    t1, s1 = df.iloc[df[df.Speed > target_speed].index[0] - 1].Time, df.iloc[df[df.Speed > target_speed].index[0] - 1].Speed
-    t2, s2 = df.iloc[df[df.Speed > target_speed].index[0]].Time, df.iloc[df[df.Speed > target_speed].index[0]].Speed
+    speed = df['Speed'].to_numpy(dtype=float)
+    time = df['Time'].to_numpy(dtype=float)
 
-    t_target = t1 + (t2 - t1)*(target_speed - s1)/(s2 - s1)
+    # Sorted search on the running max speed, see _acc_times
+    t_target = _acc_times(speed, time, targets=(target_speed,))[0]
+    if np.isnan(t_target):
+        raise IndexError(f"Speed never crosses {target_speed} km/h")
 
     acc_time = t_target    #- df.iloc[df[df.Distance > 0].index[0] - 1].Time, use if you want to exclude reaction time
 
-    return round(acc_time,2)
+    return round(float(acc_time),2)
 
 
-def get_acc_df(session):
+def _acc_times(speed, time, targets=(100, 200)):
+
+    """
+    Estimate the timestamps at which a car first exceeds each target speed.
+
+    Parameters
+    ----------
+    speed : numpy.ndarray
+        Speed samples in km/h.
+    time : numpy.ndarray
+        Time samples in seconds, aligned with `speed`.
+    targets : tuple of float, optional, default=(100, 200)
+        Target speeds in km/h, in ascending order.
+
+    Returns
+    -------
+    numpy.ndarray
+        Interpolated time (in seconds) for each target speed. NaN where the
+        target speed is never crossed; NaN speed samples never count as a crossing.
+    """
+
+    targets = np.asarray(targets, dtype=float)
+    if len(speed) < 2:
+        return np.full(targets.shape, np.nan)
+
+    # Running max is monotonic, so a single sorted search finds the first
+    # sample strictly above every target at once. NaN samples count as -inf so
+    # they neither cross a target nor break the ordering.
+    running_max = np.maximum.accumulate(np.where(np.isnan(speed), -np.inf, speed))
+    idx = np.searchsorted(running_max, targets, side='right')
+    valid = (idx > 0) & (idx < len(speed))
+    idx = np.clip(idx, 1, len(speed) - 1)
+
+    t1, s1 = time[idx-1], speed[idx-1]
+    t2, s2 = time[idx], speed[idx]
+
+    # Clipped indices of uncrossed targets can divide by zero; those are masked below
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t_target = t1 + (t2 - t1)*(targets - s1)/(s2 - s1)
+
+    return np.where(valid, t_target, np.nan)
+
+
+def get_acc_df(session, laps=None, max_workers=8):
 
     """
     Compute acceleration performance metrics (0–100 km/h and 100–200 km/h) for all drivers in a session.
@@ -77,12 +363,17 @@ def get_acc_df(session):
     - Extracts telemetry (time and speed) from lap 1.
     - Computes the time to 100 km/h.
     - Computes the time difference between 100 and 200 km/h.
-    - Returns NaN if data is unavailable or incomplete.
+    - Returns NaN for a metric whose target speed is never reached,
+      and skips drivers whose lap 1 telemetry is unavailable.
 
     Parameters
     ----------
     session : fastf1.core.Session
         The loaded FastF1 session object.
+    laps : fastf1.core.Laps, optional
+        Laps to use instead of `session.laps` (e.g. from `load_laps_cached`).
+    max_workers : int, optional, default=8
+        Number of threads fetching drivers in parallel. Use 1 to run serially.
 
     Returns
     -------
@@ -93,25 +384,42 @@ def get_acc_df(session):
     """
 
     drivers = session.drivers
-    driver_dict = {}
-    for driver in drivers:
+    if laps is None:
+        laps = session.laps
+
+    # Pick lap 1 once and split it by driver number, instead of re-filtering all laps per driver
+    lap1 = dict(tuple(laps.pick_laps(1).groupby('DriverNumber')))
+    abbr_map = {driver: session.get_driver(driver).Abbreviation for driver in drivers}
+
+    def _one_driver(driver):
         try:
-            df = session.laps.pick_laps(1).pick_drivers(driver).get_car_data(interpolate_edges=True)[['Time','Speed']].add_distance()
-            df['Time'] = df['Time'].dt.total_seconds()
-        except:
+            tel = _telemetry_arrays(session, driver, 'lap1', laps=laps, lap1=lap1)
+            speed, time = tel['Speed'], tel['Time']
+        except (IndexError, KeyError, AttributeError, ValueError):
+            # Reported after the pool, so messages from workers don't interleave
+            return driver, None
+
+        # NaN for any target the car never reaches on lap 1
+        t100, t200 = np.round(_acc_times(speed, time, targets=(100, 200)), 2)
+        return driver, [t100, round(t200 - t100, 2)]
+
+    # Telemetry slicing is read-only on the session, so drivers can be fetched concurrently
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        rows = list(pool.map(_one_driver, drivers))
+
+    driver_dict = {}
+    for driver, row in rows:
+        if row is None:
             print('Error loading telemetry for driver:', driver)
-            continue
-        try:
-            driver_dict[session.get_driver(driver).Abbreviation] = [get_acc_time(df,100),round(get_acc_time(df,200)-get_acc_time(df,100),2)]
-        except:
-            driver_dict[session.get_driver(driver).Abbreviation] = [np.nan,np.nan]
-    
-    return pd.DataFrame(driver_dict).T.set_axis(labels=['0-100','100-200'],axis=1)
+        else:
+            driver_dict[abbr_map[driver]] = row
 
+    return pd.DataFrame.from_dict(driver_dict, orient='index', columns=['0-100','100-200'])
 
-def get_driver_stint_models(session, drivers, iFuelLoad=108, FC_factor=0.035):
+
+def get_driver_stint_models(session, drivers, iFuelLoad=108, FC_factor=0.035, laps=None, max_workers=8):
     """
-    Extract stint-wise OLS models for given drivers in a session.
+    Extract stint-wise linear tyre degradation fits for given drivers in a session.
     
     Parameters
     ----------
@@ -123,50 +431,68 @@ def get_driver_stint_models(session, drivers, iFuelLoad=108, FC_factor=0.035):
         Initial fuel load in kilograms.
     FC_factor : float, optional, default=0.035
         Fuel correction factor in seconds per kilogram.
+    laps : fastf1.core.Laps, optional
+        Laps to use instead of `session.laps` (e.g. from `load_laps_cached`).
+    max_workers : int, optional, default=8
+        Number of threads fitting drivers in parallel. Use 1 to run serially.
     
     Returns
     -------
     dict
-        {driver_abbr: [(compound, model_object), ...]}
+        {driver_abbr: [(compound, LinFit), ...]}
     """
-    results = {}
+    session_laps = session.laps if laps is None else laps
 
-    for drv_abbr in drivers:
-        laps = session.laps.pick_drivers(drv_abbr)[[
-            'LapNumber', 'LapTime', 'Stint', 'Compound', 'TyreLife',
-            'TrackStatus', 'PitInTime', 'PitOutTime'
-        ]].pick_quicklaps()
+    # Session-invariant fuel correction terms (see fuel_correction / _fuel_corrected)
+    total_laps = session.total_laps
+    k = (iFuelLoad/total_laps) * FC_factor
 
-        # Drop laps under yellow/red flags
-        laps = laps[~(laps.TrackStatus.str.contains('4'))]
+    def _fit_one(drv_abbr):
+        drv_laps = session_laps.pick_drivers(drv_abbr)
 
-        stint_models = []
+        # Quick laps (as in Laps.pick_quicklaps), excluding laps under yellow/red flags
+        lap_time = drv_laps['LapTime']
+        clean = (lap_time < lap_time.min() * Laps.QUICKLAP_THRESHOLD) \
+            & ~drv_laps['TrackStatus'].astype('string').str.contains('4', regex=False, na=False)
 
-        for stint_num, stint_df in laps.groupby('Stint'):
-            if len(stint_df) < 10:
-                continue
+        # Keep stints with at least 10 clean laps, then exclude in/out laps
+        stint_len = drv_laps['Stint'].map(drv_laps.loc[clean, 'Stint'].value_counts())
+        mask = clean & (stint_len >= 10) & drv_laps['PitInTime'].isnull() & drv_laps['PitOutTime'].isnull()
 
-            # Exclude in/out laps
-            stint_df = stint_df[(stint_df.PitInTime.isnull()) & (stint_df.PitOutTime.isnull())].copy()
-            if stint_df.empty:
-                continue
+        laps = drv_laps.loc[mask, ['LapNumber', 'LapTime', 'Stint', 'Compound', 'TyreLife']]
 
-            # Convert to seconds
-            stint_df['LapTime'] = stint_df.LapTime.dt.total_seconds()
+        # Convert to seconds and apply fuel correction once for all stints
+        laps = laps.astype({'Compound': 'category'}).assign(LapTime=laps['LapTime'].dt.total_seconds())
+        lt = laps['LapTime'].to_numpy(dtype=np.float64)
+        ln = laps['LapNumber'].to_numpy(dtype=np.float64)
+        laps['CorrLap'] = _fuel_corrected(lt, ln, total_laps, k)
 
-            # Apply fuel correction
-            corrected_times = fuel_correction(session, stint_df, iFuelLoad=iFuelLoad, FC_factor=FC_factor)
+        stint_models = []
+        errors = []
 
-            x = sm.add_constant(stint_df['TyreLife'])
-            y = corrected_times
+        for stint_num, stint_df in laps.groupby('Stint', sort=False):
+            x = stint_df['TyreLife'].to_numpy(dtype=np.float64)
+            y = stint_df['CorrLap'].to_numpy(dtype=np.float64)
 
             try:
-                model = sm.OLS(y, x).fit()
+                model = _fit_stint(x, y)
                 compound = stint_df['Compound'].iloc[0]
                 stint_models.append((compound, model))
-            except Exception as e:
-                print(f"Error for {drv_abbr} stint {stint_num}: {e}")
+            except np.linalg.LinAlgError as e:
+                # Reported after the pool, so messages from workers don't interleave
+                errors.append(f"Error for {drv_abbr} stint {stint_num}: {e}")
 
+        return drv_abbr, stint_models, errors
+
+    # Drivers are independent and the work sits in pandas/NumPy kernels, so threads
+    # overlap it without pickling the session
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        fits = list(pool.map(_fit_one, drivers))
+
+    results = {}
+    for drv_abbr, stint_models, errors in fits:
+        for msg in errors:
+            print(msg)
         if stint_models:
             results[drv_abbr] = stint_models
 
@@ -202,32 +528,33 @@ def compare_car_speeds(session, drivers, corner_inputs, delta=10):
         DataFrame indexed by driver abbreviations with columns:
         ["TopSpeed", "HighSpeedAvg", "LowSpeedAvg", MediumSpeedAvg]
     """
-    corner_df = session.get_circuit_info().corners
-    results = {}
-
-    for drv in drivers:
-        tel = session.laps.pick_drivers(drv).pick_fastest().get_telemetry()
-        metrics = {}
+    corner_dist = _circuit_info(session).corners['Distance'].to_numpy()
+    cat_dists = {category: corner_dist[np.asarray(corners, dtype=int) - 1]
+                 for category, corners in corner_inputs.items()}
+    cols = ["TopSpeed"] + [f"{category.capitalize()}SpeedAvg" for category in cat_dists]
+    out = np.empty((len(drivers), len(cols)))
+
+    for i, drv in enumerate(drivers):
+        tel = _telemetry_arrays(session, drv, 'fastest')
+        dist, speed = tel['Distance'], tel['Speed']
+        # Prefix sums give the speed total of any window in O(1)
+        csum = np.concatenate([[0.0], np.cumsum(speed)])
 
         # --- Top Speed (track max) ---
-        metrics["TopSpeed"] = tel.Speed.max()
+        out[i, 0] = speed.max()
 
         # --- Loop through corner categories (high/low/medium etc.) ---
-        for category, corners in corner_inputs.items():
-            speeds = []
-            for c in corners:
-                d = corner_df.iloc[c-1].Distance
-                mask = (tel.Distance > d - delta) & (tel.Distance < d + delta)
-                speeds.extend(tel[mask].Speed.tolist())
+        for j, d in enumerate(cat_dists.values(), start=1):
+            # Distance is cumulative, so each (d - delta, d + delta) window is a contiguous slice
+            lo = np.searchsorted(dist, d - delta, side='right')
+            hi = np.searchsorted(dist, d + delta, side='left')
+            hi = np.maximum(hi, lo)
+            total = (csum[hi] - csum[lo]).sum()
+            n = (hi - lo).sum()
             # store category average
-            if speeds:
-                metrics[f"{category.capitalize()}SpeedAvg"] = sum(speeds) / len(speeds)
-            else:
-                metrics[f"{category.capitalize()}SpeedAvg"] = None
+            out[i, j] = total / n if n else np.nan
 
-        results[drv] = metrics
-
-    return round(pd.DataFrame(results).T)
+    return pd.DataFrame(np.round(out), index=drivers, columns=cols)
 
 
 def compute_track_dominance_multi(session, drivers, circuit_length, window_size=200, rotation=None, colors_map=None):
@@ -255,7 +582,7 @@ def compute_track_dominance_multi(session, drivers, circuit_length, window_size=
     points : np.ndarray
         Array of (x, y) coordinates reshaped for LineCollection plotting.
     segments : np.ndarray
-        Array of line segments for LineCollection.
+        Array of line segments for LineCollection (a read-only view on `points`).
     colors : np.ndarray
         Array of colors corresponding to which driver is fastest at each point.
     """
@@ -271,15 +598,18 @@ def compute_track_dominance_multi(session, drivers, circuit_length, window_size=
     xs, ys, speeds = [], [], []
 
     for drv in drivers:
-        df = session.laps.pick_drivers(drv).pick_fastest().telemetry[['Distance','X','Y','Speed']].copy()
+        tel = _telemetry_arrays(session, drv, 'fastest')
 
-        # Interpolation
-        x = np.interp(distance_grid, df['Distance'], df['X'])
-        y = np.interp(distance_grid, df['Distance'], df['Y'])
-        speed = np.interp(distance_grid, df['Distance'], df['Speed'])
+        # Interpolation: locate the grid in Distance once, reuse the weights for X, Y and Speed
+        d = tel['Distance']
+        idx = np.clip(np.searchsorted(d, distance_grid, side='right') - 1, 0, len(d) - 2)
+        span = d[idx+1] - d[idx]
+        frac = np.divide(distance_grid - d[idx], span, out=np.zeros_like(distance_grid), where=span > 0)
+        frac = np.clip(frac, 0.0, 1.0)
 
-        # Smooth speed
-        speed = pd.Series(speed).rolling(window=window_size, center=True, min_periods=1).mean().to_numpy()
+        x = tel['X'][idx] + frac*(tel['X'][idx+1] - tel['X'][idx])
+        y = tel['Y'][idx] + frac*(tel['Y'][idx+1] - tel['Y'][idx])
+        speed = tel['Speed'][idx] + frac*(tel['Speed'][idx+1] - tel['Speed'][idx])
 
         xs.append(x)
         ys.append(y)
@@ -290,10 +620,18 @@ def compute_track_dominance_multi(session, drivers, circuit_length, window_size=
     ys = np.array(ys)
     speeds = np.array(speeds)
 
+    # Smooth speed: centered moving average (shrinking at the ends), from prefix sums
+    n_points = speeds.shape[1]
+    start = np.arange(n_points) - window_size//2
+    left = np.clip(start, 0, n_points)
+    right = np.clip(start + window_size, 0, n_points)
+    csum = np.concatenate([np.zeros((len(speeds), 1)), np.cumsum(speeds, axis=1)], axis=1)
+    speeds = (csum[:, right] - csum[:, left]) / (right - left)
+
     # Who’s fastest at each point?
     fastest_idx = np.argmax(speeds, axis=0)
-    fastest_drivers = [drivers[i] for i in fastest_idx]
-    colors = np.array([colors_map[d] for d in fastest_drivers])
+    color_lut = np.array([colors_map[d] for d in drivers])
+    colors = color_lut[fastest_idx]
 
     # Use average X,Y of all drivers for track midline
     x = xs.mean(axis=0)
@@ -301,14 +639,15 @@ def compute_track_dominance_multi(session, drivers, circuit_length, window_size=
 
     # Rotation
     if rotation is None:
-        rotation = session.get_circuit_info().rotation
+        rotation = _circuit_info(session).rotation
     theta = np.deg2rad(rotation)
-    x_rot = x * np.cos(theta) - y * np.sin(theta)
-    y_rot = x * np.sin(theta) + y * np.cos(theta)
+    c, s = np.cos(theta), np.sin(theta)
+    R = np.array([[c, -s], [s, c]])
+    rot = R @ np.stack([x, y])      # shape: (2, n_points)
 
     # Segments
-    points = np.array([x_rot, y_rot]).T.reshape(-1, 1, 2)
-    segments = np.concatenate([points[:-1], points[1:]], axis=1)
+    points = rot.T.reshape(-1, 1, 2)
+    segments = sliding_window_view(points.reshape(-1, 2), window_shape=(2, 2))[:, 0]
 
     return points, segments, colors
 